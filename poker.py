@@ -23,14 +23,16 @@
 
 import sys
 
-from random import randint, shuffle
-from enum import Enum
-from functools import total_ordering
+from random import Random
+from enum import IntEnum
+from itertools import combinations
+from array import array
+from functools import lru_cache
+from math import comb
 from collections import Counter
 
 
-@total_ordering
-class CardSuit(Enum):
+class CardSuit(IntEnum):
     """A class that represents the 4 suits of a playing card."""
     CLUBS = 1
     DIAMONDS = 2
@@ -38,24 +40,10 @@ class CardSuit(Enum):
     SPADES = 4
     
     def __str__(self):
-        if self.name == "CLUBS":
-            return u"\u2663"
-        elif self.name == "DIAMONDS":
-            return u"\u2666"
-        elif self.name == "HEARTS":
-            return u"\u2665"
-        elif self.name == "SPADES":
-            return u"\u2660"
-            
-    def __lt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value < other.value
-        else:
-            raise NotImplementedError
+        return _SUIT_STRINGS[self]
 
 
-@total_ordering
-class CardRank(Enum):
+class CardRank(IntEnum):
     """A class that represents the 13 ranks of a playing card."""
     DEUCE = 2
     TREY = 3
@@ -72,46 +60,67 @@ class CardRank(Enum):
     ACE = 14
     
     def __str__(self):
-        if self.name == "JACK":
-            return "J"
-        elif self.name == "QUEEN":
-            return "Q"
-        elif self.name == "KING":
-            return "K"
-        elif self.name == "ACE":
-            return "A"
-        else:
-            return str(self.value)
-            
-    def __lt__(self, other):
-        if self.__class__ is other.__class__:
-            return self.value < other.value
-        else:
-            raise NotImplementedError
+        return _RANK_STRINGS[self]
 
 
-class Card(tuple):
-    """A class that models a playing card."""
+_SUIT_STRINGS = {
+    CardSuit.CLUBS: u"\u2663",
+    CardSuit.DIAMONDS: u"\u2666",
+    CardSuit.HEARTS: u"\u2665",
+    CardSuit.SPADES: u"\u2660"
+}
+
+_RANK_STRINGS = {rank: str(rank.value) for rank in CardRank}
+_RANK_STRINGS.update({CardRank.JACK: "J", CardRank.QUEEN: "Q", CardRank.KING: "K", CardRank.ACE: "A"})
+
+
+class Card(int):
+    """
+    A class that models a playing card as a single small integer, its code.
+    The rank index (0 for a deuce to 12 for an ace) is stored in the upper bits and
+    the suit index (0 for clubs to 3 for spades) in the lowest 2 bits, so the code
+    is a number from 0 to 51 that fits in a single byte. Cards sort by rank, then suit.
+    There is only one Card object for each of the 52 cards.
+    """
     
     def __new__(cls, rank, suit):
         """rank is a CardRank object. suit is a CardSuit object."""
         assert isinstance(rank, CardRank)
         assert isinstance(suit, CardSuit)
-        return tuple.__new__(cls, (rank, suit))
+        return _ALL_CARDS[(rank - 2) << 2 | (suit - 1)]
+        
+    def __repr__(self):
+        return f"Card({self.rank!r}, {self.suit!r})"
         
     def __str__(self):
         """Returns a two character string representation of the card."""
-        return "{}{}".format(self[0], self[1])
+        return _CARD_STRINGS[self]
         
     @property
     def rank(self):
         """Get this card's rank."""
-        return self[0]
+        return _RANKS[self >> 2]
         
     @property
     def suit(self):
         """Get this card's suit."""
-        return self[1]
+        return _SUITS[self & 3]
+        
+    @property
+    def code(self):
+        """Get this card's code as a plain int."""
+        return int(self)
+        
+
+_RANKS = tuple(CardRank)
+
+_SUITS = tuple(CardSuit)
+
+# The 52 cards of a standard deck, indexed by card code. Every CardDeck holds
+# these same card objects rather than creating its own.
+_ALL_CARDS = tuple(int.__new__(Card, code) for code in range(52))
+
+_CARD_STRINGS = tuple("{}{}".format(card.rank, card.suit) for card in _ALL_CARDS)
         
 
 class OutOfCards(Exception):
@@ -120,32 +129,36 @@ class OutOfCards(Exception):
         
 
 class CardDeck:
-    """A class that models a standard deck of playing cards."""
+    """
+    A class that models a standard deck of playing cards.
+    The deck holds the 52 shared card objects and reshuffles them in place. The cards that haven't
+    been dealt yet are self.cards[:self._cursor] and are dealt from the end.
+    """
     
     def __init__(self):
         """Create all the cards in the deck and shuffles them."""
+        self._rng = Random()
+        self.cards = list(_ALL_CARDS)
         self.reset()
         
     def print(self):
         """Diagnotic method to print out all the cards in the deck."""
-        for i in range(len(self.cards)):
+        for i in range(self._cursor):
             print(f"Card #{i+1}: {self.cards[i]}")
     
     def reset(self):
         """Returns all dealt cards back into the card deck and reshuffles them."""
-        self.cards = []
-        for suit in CardSuit:
-            for rank in CardRank:
-                self.cards.append(Card(rank, suit))
-        shuffle(self.cards)
+        self._rng.shuffle(self.cards)
+        self._cursor = len(self.cards)
         
     def deal_card(self):
         """
         Removes a single card from the card deck and returns it.
         An OutOfCards exception is raised if the card deck doesn't have enough cards.
         """
-        if len(self.cards) - 1 > 0:
-            return self.cards.pop()
+        if self._cursor > 0:
+            self._cursor -= 1
+            return self.cards[self._cursor]
         else:
             raise OutOfCards
         
@@ -154,22 +167,179 @@ class CardDeck:
         Removes the specified number of cards from the card deck and returns them.
         An OutOfCards exception is raised if the card deck doesn't have enough cards.
         """
-        dealt_cards = []
-        if len(self.cards) - number_of_cards > 0:
-            for i in range(number_of_cards):
-                dealt_cards.append(self.cards.pop())
-        else:
+        if number_of_cards > self._cursor:
             raise OutOfCards
+        dealt_cards = self.cards[self._cursor-number_of_cards:self._cursor][::-1]
+        self._cursor -= number_of_cards
         return dealt_cards
     
     
+# The A-2-3-4-5 straight (the wheel), where the ace plays low.
+WHEEL_MASK = 0x100F
+
+# The rank of the high card of each of the 10 possible straights, keyed by the
+# rank bitmask of the straight. Bit 0 is a deuce and bit 12 is an ace.
+STRAIGHT_HIGH_RANKS = {0x1F << i: CardRank(i + 6) for i in range(9)}
+STRAIGHT_HIGH_RANKS[WHEEL_MASK] = CardRank.FIVE
+
+# The 13 rank counts of a hand are packed into one integer with 4 bits per rank,
+# deuce in the lowest 4 bits. A card adds 1 << (4 * rank index) to the field, which
+# is 1 << (card & ~3). The field identifies the ranks in a hand and how many
+# times each occurs, regardless of card order.
+RANK_COUNT_BITS = 4
+
+
+class HandCategory(IntEnum):
+    """A class that represents the 9 categories of a poker hand, best first."""
+    STRAIGHT_FLUSH = 1
+    FOUR_OF_A_KIND = 2
+    FULL_HOUSE = 3
+    FLUSH = 4
+    STRAIGHT = 5
+    THREE_OF_A_KIND = 6
+    TWO_PAIRS = 7
+    ONE_PAIR = 8
+    HIGH_CARD = 9
+    
+    @classmethod
+    def from_score(cls, score):
+        """Returns the category of a hand with the given PokerHandEvaluator score."""
+        for worst_score, category in _CATEGORY_WORST_SCORES:
+            if score <= worst_score:
+                return category
+        raise ValueError(f"Invalid hand score: {score}")
+
+
+# The worst (highest) score of each hand category.
+_CATEGORY_WORST_SCORES = (
+    (10, HandCategory.STRAIGHT_FLUSH),
+    (166, HandCategory.FOUR_OF_A_KIND),
+    (322, HandCategory.FULL_HOUSE),
+    (1599, HandCategory.FLUSH),
+    (1609, HandCategory.STRAIGHT),
+    (2467, HandCategory.THREE_OF_A_KIND),
+    (3325, HandCategory.TWO_PAIRS),
+    (6185, HandCategory.ONE_PAIR),
+    (7462, HandCategory.HIGH_CARD)
+)
+
+
+def _build_lookup_tables():
+    """
+    Scores every distinct five-card poker hand from 1 (a royal flush) to 7462
+    (7-5-4-3-2 of mixed suits), best hand first. Returns a table of flush scores
+    and a table of all other scores, both keyed by the hand's packed rank counts.
+    """
+    flush_lookup = {}
+    unsuited_lookup = {}
+    rank_indices = range(12, -1, -1)
+    
+    def rank_counts_key(rank_counts):
+        return sum(count << (RANK_COUNT_BITS * rank_index) for rank_index, count in rank_counts)
+        
+    def mask_key(mask):
+        return rank_counts_key((rank_index, 1) for rank_index in range(13) if mask & (1 << rank_index))
+        
+    straights = [0x1F << shift for shift in range(8, -1, -1)] + [WHEEL_MASK]
+    no_pairs = sorted((mask for mask in range(1 << 13) if bin(mask).count("1") == 5 and mask not in STRAIGHT_HIGH_RANKS), reverse=True)
+    
+    scores = iter(range(1, 7463))
+    for mask in straights:
+        flush_lookup[mask_key(mask)] = next(scores)
+    for quads in rank_indices:
+        for kicker in rank_indices:
+            if kicker != quads:
+                unsuited_lookup[rank_counts_key(((quads, 4), (kicker, 1)))] = next(scores)
+    for trips in rank_indices:
+        for pair in rank_indices:
+            if pair != trips:
+                unsuited_lookup[rank_counts_key(((trips, 3), (pair, 2)))] = next(scores)
+    for mask in no_pairs:
+        flush_lookup[mask_key(mask)] = next(scores)
+    for mask in straights:
+        unsuited_lookup[mask_key(mask)] = next(scores)
+    for trips in rank_indices:
+        kickers = [rank_index for rank_index in rank_indices if rank_index != trips]
+        for kicker1, kicker2 in combinations(kickers, 2):
+            unsuited_lookup[rank_counts_key(((trips, 3), (kicker1, 1), (kicker2, 1)))] = next(scores)
+    for pair1, pair2 in combinations(rank_indices, 2):
+        for kicker in rank_indices:
+            if kicker != pair1 and kicker != pair2:
+                unsuited_lookup[rank_counts_key(((pair1, 2), (pair2, 2), (kicker, 1)))] = next(scores)
+    for pair in rank_indices:
+        kickers = [rank_index for rank_index in rank_indices if rank_index != pair]
+        for kicker1, kicker2, kicker3 in combinations(kickers, 3):
+            unsuited_lookup[rank_counts_key(((pair, 2), (kicker1, 1), (kicker2, 1), (kicker3, 1)))] = next(scores)
+    for mask in no_pairs:
+        unsuited_lookup[mask_key(mask)] = next(scores)
+    return flush_lookup, unsuited_lookup
+    
+    
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_lookup_tables()
+
+
 class PokerHandEvaluator:
     """A class to evaluate a five-card draw poker hand."""
     
     def __init__(self, cards):
-        """Initializes the evaluator with a list of 5 card objects."""
-        assert isinstance(cards, list) and all(isinstance(element, Card) for element in cards)
-        self.cards = cards
+        """
+        Initializes the evaluator with a list of 5 card objects or card codes.
+        The sorted hand, rank counts, rank bitmask and suit bitmask are computed
+        once here and shared by all of the is_* methods.
+        """
+        assert isinstance(cards, list) and all(isinstance(element, int) and 0 <= element < 52 for element in cards)
+        self.cards = [_ALL_CARDS[card] for card in cards]
+        self._sorted = sorted(self.cards)
+        self._rank_counts = Counter(card.rank for card in self.cards)
+        (self._first_rank, self._first_count), (self._second_rank, self._second_count) = self._rank_counts.most_common(2)
+        self.rank_mask = 0
+        self.suit_mask = 0
+        self.rank_counts = 0
+        for card in cards:
+            self.rank_mask |= 1 << (card >> 2)
+            self.suit_mask |= 1 << (card & 3)
+            self.rank_counts += 1 << (card & ~3)
+            
+    def score(self):
+        """
+        Returns the score of this poker hand from 1 (a royal flush) to 7462 (7-5-4-3-2 of mixed suits).
+        Lower scores are better hands. Use HandCategory.from_score() to get the category of the hand.
+        """
+        if (self.suit_mask & (self.suit_mask - 1)) == 0:
+            return FLUSH_LOOKUP[self.rank_counts]
+        return UNSUITED_LOOKUP[self.rank_counts]
+        
+    def classify(self):
+        """
+        Classifies this poker hand in a single pass over the cached rank counts and bitmasks.
+        Returns a tuple of the HandCategory of the hand and a tuple of the ranks that decide
+        between hands of that category, most significant first. For a straight that is just
+        the rank of its high card. For every other hand the ranks are ordered by how many
+        times they occur, then from highest to lowest.
+        """
+        rank_counts = self._rank_counts
+        ranks = tuple(sorted(rank_counts, key=lambda rank: (rank_counts[rank], rank), reverse=True))
+        most_occurrences = rank_counts[ranks[0]]
+        is_flush = (self.suit_mask & (self.suit_mask - 1)) == 0
+        straight_rank = STRAIGHT_HIGH_RANKS.get(self.rank_mask)
+        if straight_rank and is_flush:
+            return (HandCategory.STRAIGHT_FLUSH, (straight_rank,))
+        elif most_occurrences == 4:
+            return (HandCategory.FOUR_OF_A_KIND, ranks)
+        elif most_occurrences == 3 and len(ranks) == 2:
+            return (HandCategory.FULL_HOUSE, ranks)
+        elif is_flush:
+            return (HandCategory.FLUSH, ranks)
+        elif straight_rank:
+            return (HandCategory.STRAIGHT, (straight_rank,))
+        elif most_occurrences == 3:
+            return (HandCategory.THREE_OF_A_KIND, ranks)
+        elif most_occurrences == 2 and len(ranks) == 3:
+            return (HandCategory.TWO_PAIRS, ranks)
+        elif most_occurrences == 2:
+            return (HandCategory.ONE_PAIR, ranks)
+        else:
+            return (HandCategory.HIGH_CARD, ranks)
         
     def is_straight_flush(self):
         """
@@ -177,7 +347,7 @@ class PokerHandEvaluator:
         Returns the rank of the highest ranking card if it is a straight flush.
         Otherwise, None is returned.
         """
-        return self.high_card().rank if self.is_straight() and self.is_flush() else None
+        return self.is_straight() if self.is_flush() else None
     
     def is_four_of_a_kind(self):
         """
@@ -185,10 +355,7 @@ class PokerHandEvaluator:
         Returns the rank of the high card if it is a four of a kind.
         Otherwise, None is returned.
         """
-        for rank, occurrences in Counter(card.rank for card in self.cards).items():
-            if occurrences == 4:
-                return rank
-        return None
+        return self._first_rank if self._first_count == 4 else None
     
     def is_full_house(self):
         """
@@ -197,14 +364,7 @@ class PokerHandEvaluator:
         Returns a tuple with the rank of the three matching cards and the two matching cards.
         Otherwise, None is returned.
         """
-        three_matching_cards = []
-        two_matching_cards = []
-        for rank, occurrences in Counter(card.rank for card in self.cards).items():
-            if occurrences == 3:
-                three_matching_cards.append(rank)
-            elif occurrences == 2:
-                two_matching_cards.append(rank)
-        return (three_matching_cards[0], two_matching_cards[0]) if len(three_matching_cards) == 1 and len(two_matching_cards) == 1 else None
+        return (self._first_rank, self._second_rank) if self._first_count == 3 and self._second_count == 2 else None
         
     def is_flush(self):
         """
@@ -212,27 +372,16 @@ class PokerHandEvaluator:
         Returns the rank of the high card if it is a flush.
         Otherwise, None is returned.
         """
-        suits_set = {*[card.suit for card in self.cards]}
-        return sorted(self.cards)[-1].rank if len(suits_set) == 1 else None
+        return self._sorted[-1].rank if (self.suit_mask & (self.suit_mask - 1)) == 0 else None
     
     def is_straight(self):
         """
         Determines whether this poker hand contains a straight.
-        Returns the rank of the high card if it is a straight.
+        Returns the rank of the high card if it is a straight. The ace plays low in
+        the A-2-3-4-5 straight, so its high card is the five.
         Otherwise, None is returned.
         """
-        contains_duplicates = False
-        for occurrences in Counter(card.rank for card in self.cards).values():
-            if occurrences > 1:
-                contains_duplicates = True
-                break
-        if not contains_duplicates:
-            sorted_hand_ranks = [card.rank for card in sorted(self.cards)]
-            if sorted_hand_ranks[-1].value - sorted_hand_ranks[0].value == 4:
-                return sorted_hand_ranks[-1]
-            return None
-        else:
-            return None
+        return STRAIGHT_HIGH_RANKS.get(self.rank_mask)
     
     def is_three_of_a_kind(self):
         """
@@ -240,44 +389,170 @@ class PokerHandEvaluator:
         Returns the rank of the high card if it is a three of a kind.
         Otherwise, None is returned.
         """
-        for rank, occurrences in Counter(card.rank for card in self.cards).items():
-            if occurrences == 3:
-                return rank
-        return None
+        return self._first_rank if self._first_count == 3 else None
     
     def is_one_pair(self):
         """
         Determines whether this poker hand contains one pair.
         Returns the rank of the pair. Otherwise, None is returned.
         """
-        total_pairs = []
-        for rank, occurrences in Counter(card.rank for card in self.cards).items():
-            if occurrences == 2:
-                total_pairs.append(rank)
-        if len(total_pairs) == 1:
-            return total_pairs[0]
+        if self._first_count == 2 and self._second_count < 2:
+            return self._first_rank
+        elif self._first_count == 3 and self._second_count == 2:
+            return self._second_rank
         else:
             return None
             
     def is_two_pairs(self):
         """
         Determines whether this poker hand contains two pair.
-        Returns the ranks of the pairs as a tuple. Otherwise, None is returned.
+        Returns the ranks of the pairs as a tuple, highest pair first. Otherwise, None is returned.
         """
-        total_pairs = []
-        for rank, occurrences in Counter(card.rank for card in self.cards).items():
-            if occurrences == 2:
-                total_pairs.append(rank)
-        if len(total_pairs) == 2:
-            return (total_pairs[0], total_pairs[1])
+        if self._first_count == 2 and self._second_count == 2:
+            return (max(self._first_rank, self._second_rank), min(self._first_rank, self._second_rank))
         else:
             return None
         
     def high_card(self):
         """Returns the high card in this poker hand."""
-        return sorted(self.cards, reverse=True)[0]
+        return self._sorted[-1]
+    
+    
+def evaluate5(cards):
+    """
+    Scores a single five-card poker hand given as a sequence of 5 cards or card codes.
+    Returns the same score as PokerHandEvaluator.score() without creating an evaluator.
+    """
+    # A hand always has exactly 5 cards, so the work is written out per card with no loop.
+    c0, c1, c2, c3, c4 = cards
+    rank_counts = (1 << (c0 & ~3)) + (1 << (c1 & ~3)) + (1 << (c2 & ~3)) + (1 << (c3 & ~3)) + (1 << (c4 & ~3))
+    if ((c0 ^ c1) | (c0 ^ c2) | (c0 ^ c3) | (c0 ^ c4)) & 3:
+        return UNSUITED_LOOKUP[rank_counts]
+    return FLUSH_LOOKUP[rank_counts]
+    
     
+def evaluate_batch(hands):
+    """
+    Scores many five-card poker hands in one call. hands is a sequence of hands where
+    each hand is a sequence of 5 cards or card codes. Returns an array of
+    the PokerHandEvaluator scores of the hands, in the same order.
+    """
+    return array("H", map(evaluate5, hands))
     
+    
+def batch_deal(number_of_hands, number_of_cards=5, rng=None):
+    """
+    Deals many hands at once, each from its own freshly shuffled deck. Each hand is a
+    list of number_of_cards distinct card codes (see Card), so the result can be
+    passed straight to evaluate_batch(). rng is an optional random.Random instance.
+    """
+    if rng is None:
+        rng = Random()
+    sample = rng.sample
+    card_codes = range(len(_ALL_CARDS))
+    return [sample(card_codes, number_of_cards) for i in range(number_of_hands)]
+    
+    
+# The number of distinct five-card hands, C(52, 5).
+NUMBER_OF_HANDS = 2598960
+
+# _BINOMIALS[k][n] is C(n, k), the number of ways of choosing k of n cards.
+_BINOMIALS = [[comb(n, k) for n in range(52)] for k in range(6)]
+
+
+def hand_index(cards):
+    """
+    Returns the index of a hand of 5 distinct cards or card codes among all
+    NUMBER_OF_HANDS hands in colexicographic order. The order of the cards doesn't matter.
+    """
+    c0, c1, c2, c3, c4 = sorted(cards)
+    binomials = _BINOMIALS
+    return c0 + binomials[2][c1] + binomials[3][c2] + binomials[4][c3] + binomials[5][c4]
+    
+    
+@lru_cache(maxsize=None)
+def score_table():
+    """
+    Returns an array of the scores of all NUMBER_OF_HANDS hands indexed by hand_index().
+    The table takes about 5 MB and is built on the first call, then reused.
+    """
+    flush_lookup = FLUSH_LOOKUP
+    unsuited_lookup = UNSUITED_LOOKUP
+    table = array("H")
+    # The hands are visited in colexicographic order, so the scores are simply appended.
+    # The rank counts and suit mask of the higher cards are carried into the inner loops.
+    for c4 in range(4, 52):
+        rank_counts4 = 1 << (c4 & ~3)
+        suit_mask4 = 1 << (c4 & 3)
+        for c3 in range(3, c4):
+            rank_counts3 = rank_counts4 + (1 << (c3 & ~3))
+            suit_mask3 = suit_mask4 | 1 << (c3 & 3)
+            for c2 in range(2, c3):
+                rank_counts2 = rank_counts3 + (1 << (c2 & ~3))
+                suit_mask2 = suit_mask3 | 1 << (c2 & 3)
+                for c1 in range(1, c2):
+                    rank_counts1 = rank_counts2 + (1 << (c1 & ~3))
+                    suit_mask1 = suit_mask2 | 1 << (c1 & 3)
+                    for c0 in range(c1):
+                        rank_counts = rank_counts1 + (1 << (c0 & ~3))
+                        suit_mask = suit_mask1 | 1 << (c0 & 3)
+                        if (suit_mask & (suit_mask - 1)) == 0:
+                            table.append(flush_lookup[rank_counts])
+                        else:
+                            table.append(unsuited_lookup[rank_counts])
+    return table
+    
+    
+def simulate_equity(hero, villain, number_of_trials, rng=None):
+    """
+    Estimates how often the hero's hand beats the villain's hand at showdown. hero and
+    villain are lists of up to 5 known cards or card codes. In each trial, the missing
+    cards of both hands are dealt at random from the rest of the deck. A tie counts as
+    half a win. Returns the hero's share of the pot as a number from 0.0 to 1.0.
+    rng is an optional random.Random instance.
+    """
+    assert isinstance(hero, list) and len(hero) <= 5
+    assert isinstance(villain, list) and len(villain) <= 5
+    assert len(set(hero) | set(villain)) == len(hero) + len(villain)
+    assert number_of_trials > 0
+    if rng is None:
+        rng = Random()
+    randrange = rng.randrange
+    known_cards = set(hero) | set(villain)
+    deck = [card for card in _ALL_CARDS if card not in known_cards]
+    deck_size = len(deck)
+    hero_missing = 5 - len(hero)
+    number_missing = hero_missing + 5 - len(villain)
+    half_wins = 0
+    for trial in range(number_of_trials):
+        # Only the front of the deck needs shuffling, one swap per missing card.
+        for i in range(number_missing):
+            j = randrange(i, deck_size)
+            deck[i], deck[j] = deck[j], deck[i]
+        hero_score = evaluate5(hero + deck[:hero_missing])
+        villain_score = evaluate5(villain + deck[hero_missing:number_missing])
+        if hero_score < villain_score:
+            half_wins += 2
+        elif hero_score == villain_score:
+            half_wins += 1
+    return half_wins / (2 * number_of_trials)
+    
+    
+# The message PokerHand.evaluate() prints for each hand category. The positional
+# fields are the ranks returned by PokerHandEvaluator.classify().
+_HAND_MESSAGES = {
+    HandCategory.STRAIGHT_FLUSH: "You have a {0}-high straight flush.",
+    HandCategory.FOUR_OF_A_KIND: "You have a four of a kind of {0}.",
+    HandCategory.FULL_HOUSE: "You have a full house, {0} over {1}.",
+    HandCategory.FLUSH: "You have a {0}-high flush.",
+    HandCategory.STRAIGHT: "You have a {0}-high straight.",
+    HandCategory.THREE_OF_A_KIND: "You have a three of a kind of {0}.",
+    HandCategory.TWO_PAIRS: "You have 2 pairs of {0} and {1}.",
+    HandCategory.ONE_PAIR: "You have 1 pair of {0}.",
+    HandCategory.HIGH_CARD: "You have nothing. Your high card is {high_card}."
+}
+
+
 class PokerHand:
     """A class that models a five-card draw poker hand."""
     
@@ -307,39 +582,8 @@ class PokerHand:
         straight flush > four of a kind > full house > flush > straight > three of a kind > two pairs > one pair > high card
         """
         evaluator = PokerHandEvaluator(self.__cards)
-        straight_flush_rank = evaluator.is_straight_flush()
-        if straight_flush_rank:
-            print(f"You have a {straight_flush_rank}-high straight flush.")
-        else:
-            four_of_a_kind_rank = evaluator.is_four_of_a_kind()
-            if four_of_a_kind_rank:
-                print(f"You have a four of a kind of {four_of_a_kind_rank}.")
-            else:
-                full_house_ranks = evaluator.is_full_house()
-                if full_house_ranks:
-                    print(f"You have a full house, {full_house_ranks[0]} over {full_house_ranks[1]}.")
-                else:
-                    flush_rank = evaluator.is_flush()
-                    if flush_rank:
-                        print(f"You have a {flush_rank}-high flush.")
-                    else:
-                        straight_rank = evaluator.is_straight()
-                        if straight_rank:
-                            print(f"You have a {straight_rank}-high straight.")
-                        else:    
-                            three_of_a_kind_rank = evaluator.is_three_of_a_kind()
-                            if three_of_a_kind_rank:
-                                print(f"You have a three of a kind of {three_of_a_kind_rank}.")
-                            else:
-                                two_pairs_ranks = evaluator.is_two_pairs()
-                                if two_pairs_ranks:
-                                    print(f"You have 2 pairs of {two_pairs_ranks[0]} and {two_pairs_ranks[1]}.")
-                                else:
-                                    one_pair_rank = evaluator.is_one_pair()
-                                    if one_pair_rank:
-                                        print(f"You have 1 pair of {one_pair_rank}.")
-                                    else:
-                                        print(f"You have nothing. Your high card is {evaluator.high_card()}.")
+        category, ranks = evaluator.classify()
+        print(_HAND_MESSAGES[category].format(*ranks, high_card=evaluator.high_card()))
                         
 
 def main():
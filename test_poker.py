@@ -19,10 +19,37 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from poker import PokerHandEvaluator, Card, CardRank, CardSuit
+from poker import PokerHandEvaluator, Card, CardDeck, CardRank, CardSuit, HandCategory, OutOfCards, NUMBER_OF_HANDS, batch_deal, evaluate5, evaluate_batch, hand_index, score_table, simulate_equity
 
 """Test cases for the poker module."""
 
+def test_card():
+    card = Card(CardRank.QUEEN, CardSuit.HEARTS)
+    assert card is Card(CardRank.QUEEN, CardSuit.HEARTS)
+    assert card == (12 - 2) << 2 | (3 - 1)
+    assert card.rank == CardRank.QUEEN and card.suit == CardSuit.HEARTS
+    assert str(card) == "Q\u2665"
+    assert Card(CardRank.DEUCE, CardSuit.SPADES) < Card(CardRank.TREY, CardSuit.CLUBS)
+    
+def test_carddeck_deal_cards():
+    deck = CardDeck()
+    dealt_cards = deck.deal_cards(5) + [deck.deal_card() for i in range(5)]
+    assert len(set(dealt_cards)) == 10
+    
+    deck.reset()
+    dealt_cards = deck.deal_cards(51) + [deck.deal_card()]
+    assert len(set(dealt_cards)) == 52
+    
+    try:
+        deck.deal_card()
+        assert False
+    except OutOfCards:
+        pass
+    
+    deck.reset()
+    dealt_cards = deck.deal_cards(52)
+    assert len(set(dealt_cards)) == 52
+    
 def test_pokerhandevaluator_is_straight_flush():
     straight_flush = [
         Card(CardRank.QUEEN, CardSuit.HEARTS),
@@ -43,6 +70,16 @@ def test_pokerhandevaluator_is_straight_flush():
     ]
     evaluator = PokerHandEvaluator(not_straight_flush)
     assert not evaluator.is_straight_flush()
+    
+    steel_wheel = [
+        Card(CardRank.FIVE, CardSuit.DIAMONDS),
+        Card(CardRank.FOUR, CardSuit.DIAMONDS),
+        Card(CardRank.TREY, CardSuit.DIAMONDS),
+        Card(CardRank.DEUCE, CardSuit.DIAMONDS),
+        Card(CardRank.ACE, CardSuit.DIAMONDS)
+    ]
+    evaluator = PokerHandEvaluator(steel_wheel)
+    assert evaluator.is_straight_flush() == CardRank.FIVE
 
 def test_pokerhandevaluator_four_of_a_kind():
     four_of_a_kind = [
@@ -127,6 +164,16 @@ def test_pokerhandevaluator_straight():
     ]
     evaluator = PokerHandEvaluator(not_straight)
     assert not evaluator.is_straight()
+    
+    wheel = [
+        Card(CardRank.ACE, CardSuit.CLUBS),
+        Card(CardRank.DEUCE, CardSuit.SPADES),
+        Card(CardRank.TREY, CardSuit.SPADES),
+        Card(CardRank.FOUR, CardSuit.HEARTS),
+        Card(CardRank.FIVE, CardSuit.HEARTS)
+    ]
+    evaluator = PokerHandEvaluator(wheel)
+    assert evaluator.is_straight() == CardRank.FIVE
 
 def test_pokerhandevaluator_three_of_a_kind():
     three_of_a_kind = [
@@ -200,4 +247,112 @@ def test_pokerhandevaluator_high_card():
         Card(CardRank.DEUCE, CardSuit.SPADES)
     ]
     evaluator = PokerHandEvaluator(high_card)
-    assert evaluator.high_card()
\ No newline at end of file
+    assert evaluator.high_card()
+
+def test_pokerhandevaluator_score():
+    royal_flush = [
+        Card(CardRank.ACE, CardSuit.SPADES),
+        Card(CardRank.KING, CardSuit.SPADES),
+        Card(CardRank.QUEEN, CardSuit.SPADES),
+        Card(CardRank.JACK, CardSuit.SPADES),
+        Card(CardRank.TEN, CardSuit.SPADES)
+    ]
+    evaluator = PokerHandEvaluator(royal_flush)
+    assert evaluator.score() == 1
+    assert HandCategory.from_score(evaluator.score()) is HandCategory.STRAIGHT_FLUSH
+    
+    full_house = [
+        Card(CardRank.TREY, CardSuit.CLUBS),
+        Card(CardRank.TREY, CardSuit.SPADES),
+        Card(CardRank.TREY, CardSuit.DIAMONDS),
+        Card(CardRank.SIX, CardSuit.CLUBS),
+        Card(CardRank.SIX, CardSuit.HEARTS)
+    ]
+    evaluator = PokerHandEvaluator(full_house)
+    assert HandCategory.from_score(evaluator.score()) is HandCategory.FULL_HOUSE
+    
+    worst_hand = [
+        Card(CardRank.SEVEN, CardSuit.CLUBS),
+        Card(CardRank.FIVE, CardSuit.SPADES),
+        Card(CardRank.FOUR, CardSuit.HEARTS),
+        Card(CardRank.TREY, CardSuit.HEARTS),
+        Card(CardRank.DEUCE, CardSuit.SPADES)
+    ]
+    evaluator = PokerHandEvaluator(worst_hand)
+    assert evaluator.score() == 7462
+    assert PokerHandEvaluator([card.code for card in worst_hand]).score() == 7462
+    assert HandCategory.from_score(evaluator.score()) is HandCategory.HIGH_CARD
+
+def test_evaluate_batch():
+    deck = CardDeck()
+    hands = [deck.deal_cards(5) for i in range(10)]
+    codes = [[card.code for card in hand] for hand in hands]
+    scores = evaluate_batch(codes)
+    assert list(scores) == [PokerHandEvaluator(hand).score() for hand in hands]
+    assert list(scores) == [evaluate5(hand) for hand in codes]
+
+def test_pokerhandevaluator_classify():
+    full_house = [
+        Card(CardRank.TREY, CardSuit.CLUBS),
+        Card(CardRank.SIX, CardSuit.CLUBS),
+        Card(CardRank.TREY, CardSuit.SPADES),
+        Card(CardRank.SIX, CardSuit.HEARTS),
+        Card(CardRank.TREY, CardSuit.DIAMONDS)
+    ]
+    evaluator = PokerHandEvaluator(full_house)
+    assert evaluator.classify() == (HandCategory.FULL_HOUSE, (CardRank.TREY, CardRank.SIX))
+    
+    two_pairs = [
+        Card(CardRank.FOUR, CardSuit.DIAMONDS),
+        Card(CardRank.SEVEN, CardSuit.CLUBS),
+        Card(CardRank.TREY, CardSuit.HEARTS),
+        Card(CardRank.SEVEN, CardSuit.SPADES),
+        Card(CardRank.FOUR, CardSuit.HEARTS)
+    ]
+    evaluator = PokerHandEvaluator(two_pairs)
+    assert evaluator.classify() == (HandCategory.TWO_PAIRS, (CardRank.SEVEN, CardRank.FOUR, CardRank.TREY))
+    
+    wheel = [
+        Card(CardRank.ACE, CardSuit.CLUBS),
+        Card(CardRank.DEUCE, CardSuit.SPADES),
+        Card(CardRank.TREY, CardSuit.SPADES),
+        Card(CardRank.FOUR, CardSuit.HEARTS),
+        Card(CardRank.FIVE, CardSuit.HEARTS)
+    ]
+    evaluator = PokerHandEvaluator(wheel)
+    assert evaluator.classify() == (HandCategory.STRAIGHT, (CardRank.FIVE,))
+
+def test_score_table():
+    table = score_table()
+    assert len(table) == NUMBER_OF_HANDS
+    assert hand_index([0, 1, 2, 3, 4]) == 0
+    assert hand_index([51, 50, 49, 48, 47]) == NUMBER_OF_HANDS - 1
+    
+    deck = CardDeck()
+    hands = [[card.code for card in deck.deal_cards(5)] for i in range(10)]
+    assert [table[hand_index(hand)] for hand in hands] == [evaluate5(hand) for hand in hands]
+
+def test_batch_deal():
+    hands = batch_deal(100)
+    assert len(hands) == 100
+    assert all(len(set(hand)) == 5 and all(0 <= code < 52 for code in hand) for hand in hands)
+    assert len(evaluate_batch(hands)) == 100
+
+def test_simulate_equity():
+    four_of_a_kind = [
+        Card(CardRank.NINE, CardSuit.CLUBS),
+        Card(CardRank.NINE, CardSuit.SPADES),
+        Card(CardRank.NINE, CardSuit.DIAMONDS),
+        Card(CardRank.NINE, CardSuit.HEARTS),
+        Card(CardRank.JACK, CardSuit.HEARTS)
+    ]
+    full_house = [
+        Card(CardRank.TREY, CardSuit.CLUBS),
+        Card(CardRank.TREY, CardSuit.SPADES),
+        Card(CardRank.TREY, CardSuit.DIAMONDS),
+        Card(CardRank.SIX, CardSuit.CLUBS),
+        Card(CardRank.SIX, CardSuit.HEARTS)
+    ]
+    assert simulate_equity(four_of_a_kind, full_house, 10) == 1.0
+    assert simulate_equity(full_house, four_of_a_kind, 10) == 0.0
+    assert 0.0 < simulate_equity(full_house[:2], four_of_a_kind[:2], 1000) < 1.0